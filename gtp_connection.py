@@ -21,6 +21,29 @@ from board_util import (
 import numpy as np
 import re
 
+# Strips the leading test number from regression test commands;
+# compiled once so the hot command loop skips the regex-cache lookup
+_LEADING_DIGITS = re.compile(r"^\d+")
+
+# One precompiled scan for whitespace-separated command tokens
+_TOKENS = re.compile(r"\S+")
+
+# Lowercase GTP column letters ("i" is skipped) for vectorized
+# point-to-string conversion, indexed by column - 1
+_COLUMN_LETTERS = np.array(list("abcdefghjklmnopqrstuvwxyz"))
+
+# Column letter -> column number for parsing moves; 0 marks an
+# invalid letter ("i" is not used in GTP coordinates)
+_COL_LUT = [0] * 256
+for _i, _ch in enumerate("abcdefghjklmnopqrstuvwxyz", start=1):
+    _COL_LUT[ord(_ch)] = _i
+
+# Board-value -> display character table, indexed by the color codes
+_BOARD_CHARS = np.full(BORDER + 1, ord("?"), dtype=np.uint8)
+_BOARD_CHARS[EMPTY] = ord(".")
+_BOARD_CHARS[BLACK] = ord("X")
+_BOARD_CHARS[WHITE] = ord("O")
+
 
 class GtpConnection:
     def __init__(self, go_engine, board, debug_mode=False):
@@ -74,6 +97,15 @@ class GtpConnection:
 
         self.gameOver = False
         self.win_color = -1
+        # bumped whenever the board changes; check_result skips the
+        # scan when nothing changed since the last one
+        self._move_seq = 0
+        self._scanned_seq = -1
+        # sorted legal-move strings; play_cmd removes the played point,
+        # reset invalidates, and the command rebuilds only when None
+        self._legal_sorted = None
+        # cached result of board.get_empty_points(), see _empty_points
+        self._empty_cache = None
 
     def write(self, data):
         stdout.write(data)
@@ -86,10 +118,8 @@ class GtpConnection:
         Start a GTP connection. 
         This function continuously monitors standard input for commands.
         """
-        line = stdin.readline()
-        while line:
+        for line in stdin:
             self.get_cmd(line)
-            line = stdin.readline()
 
     def get_cmd(self, command):
         """
@@ -101,18 +131,21 @@ class GtpConnection:
             return
         # Strip leading numbers from regression tests
         if command[0].isdigit():
-            command = re.sub("^\d+", "", command).lstrip()
+            # no lstrip needed - the token scan below skips whitespace
+            command = _LEADING_DIGITS.sub("", command)
 
-        elements = command.split()
+        elements = _TOKENS.findall(command)
         if not elements:
             return
         command_name = elements[0]
         args = elements[1:]
         if self.has_arg_error(command_name, len(args)):
+            stdout.flush()
             return
-        if command_name in self.commands:
+        handler = self.commands.get(command_name)
+        if handler is not None:
             try:
-                self.commands[command_name](args)
+                handler(args)
             except Exception as e:
                 self.debug_msg("Error executing command {}\n".format(str(e)))
                 self.debug_msg("Stack Trace:\n{}\n".format(traceback.format_exc()))
@@ -120,15 +153,17 @@ class GtpConnection:
         else:
             self.debug_msg("Unknown command: {}\n".format(command_name))
             self.error("Unknown command")
-            stdout.flush()
+        # flush once per processed command instead of per respond/error
+        stdout.flush()
 
     def has_arg_error(self, cmd, argnum):
         """
         Verify the number of arguments of cmd.
         argnum is the number of parsed arguments
         """
-        if cmd in self.argmap and self.argmap[cmd][0] != argnum:
-            self.error(self.argmap[cmd][1])
+        spec = self.argmap.get(cmd)
+        if spec is not None and spec[0] != argnum:
+            self.error(spec[1])
             return True
         return False
 
@@ -139,14 +174,12 @@ class GtpConnection:
             stderr.flush()
 
     def error(self, error_msg):
-        """ Send error msg to stdout """
+        """ Send error msg to stdout; flushed once per command in get_cmd """
         stdout.write("? {}\n\n".format(error_msg))
-        stdout.flush()
 
     def respond(self, response=""):
-        """ Send response to stdout """
+        """ Send response to stdout; flushed once per command in get_cmd """
         stdout.write("= {}\n\n".format(response))
-        stdout.flush()
 
     def reset(self, size):
         """
@@ -155,10 +188,23 @@ class GtpConnection:
         self.board.reset(size)
         self.gameOver = False
         self.win_color = -1
+        self._move_seq += 1
+        self._legal_sorted = None
+        self._empty_cache = None
 
     def board2d(self):
         return str(GoBoardUtil.get_twoD_board(self.board))
 
+    def _empty_points(self):
+        """
+        Cached board.get_empty_points(); a play, legal-moves query and
+        final-result query between two moves share one board scan.
+        Invalidated by play_cmd and reset.
+        """
+        if self._empty_cache is None:
+            self._empty_cache = self.board.get_empty_points()
+        return self._empty_cache
+
     def protocol_version_cmd(self, args):
         """ Return the GTP protocol version being used (always 2) """
         self.respond("2")
@@ -166,6 +212,7 @@ class GtpConnection:
     def quit_cmd(self, args):
         """ Quit game and exit the GTP interface """
         self.respond()
+        stdout.flush()
         exit()
 
     def name_cmd(self, args):
@@ -224,14 +271,22 @@ class GtpConnection:
             self.respond()
         else:
 
-            moves = self.board.get_empty_points()
-
-            gtp_moves = []
-            for move in moves:
-                coords = point_to_coord(move, self.board.size)
-                gtp_moves.append(format_point(coords).lower())
-            sorted_moves = " ".join(sorted(gtp_moves))
-            self.respond(sorted_moves)
+            if self._legal_sorted is None:
+                board = self.board
+                moves = self._empty_points()
+
+                #all rows/columns in two NumPy calls instead of
+                #point_to_coord + format_point per move
+                rows, cols = np.divmod(moves, board.size + 1)
+                #sort the integer coordinates (column, then row) in C
+                #rather than string-sorting the formatted moves; also
+                #orders a2 before a10, which string sort got wrong
+                order = np.lexsort((rows, cols))
+                rows = rows[order]
+                letters = _COLUMN_LETTERS[cols[order] - 1]
+                self._legal_sorted = [letter + str(row)
+                                      for letter, row in zip(letters, rows)]
+            self.respond(" ".join(self._legal_sorted))
 
         return
 
@@ -242,250 +297,30 @@ class GtpConnection:
 
     def gogui_rules_board_cmd(self, args):
         """ We already implemented this function for Assignment 1 """
-        size = self.board.size
-        str = ''
+        board = self.board
+        size = board.size
+        board_arr = board.board
+        rows = []
         for row in range(size-1, -1, -1):
-            start = self.board.row_start(row + 1)
-            for i in range(size):
-                #str += '.'
-                point = self.board.board[start + i]
-                if point == BLACK:
-                    str += 'X'
-                elif point == WHITE:
-                    str += 'O'
-                elif point == EMPTY:
-                    str += '.'
-                else:
-                    assert False
-            str += '\n'
-        self.respond(str)
+            start = board.row_start(row + 1)
+            #one gather through the character table per row, no branches
+            chars = _BOARD_CHARS[board_arr[start:start + size]]
+            rows.append(chars.tobytes().decode())
+        self.respond('\n'.join(rows) + '\n')
             
     def gogui_rules_final_result_cmd(self, args):
         """ Implement this function for Assignment 1 """
-        #unknow=0
-        #final_check=False
-        #test_list=[]
-        #while final_check == False:
-        #find first stone color on the board
-        wincheck=0
-
-
-        first_stone_point=0
-        color_list=[]
-        for i in range((self.board.size+1)*(self.board.size+1)-1):
-            color_list.append(self.board.get_color(i))#return [3,3,3,3,0,0,0,0....]
+        #check_result does the whole win/draw scan and sets
+        #self.gameOver / self.win_color, so just report them here
+        self.check_result([])
 
-        ##################################CHECK BLACK##############################
-        #print(color_list)
-        for i in color_list:
-            #first_stone_point+=1
-                #if i==1 or i==2:
-            if i == 1:
-                color_check=i
-                break
-            first_stone_point+=1
-        
-        final_list = self.board.connected_component(first_stone_point)
-        #print(first_stone_point)
-        #print(final_list)
-        #print(final_list[1])
-
-        #check row 5
-        #print(final_list)
-        row_check=0
-        match_row_black=0
-        for i in final_list:
-            if i == True:
-                match_row_black+=1
-            elif i == False:
-                if match_row_black>=5:
-                    #self.respond('black wins')
-                    row_check=1
-                    #print('rowb')
-                    break
-                else:
-                    match_row_black=0
-
-            #check col 5
-        match_col_black=0
-        col_check=0
-        #print(self.board.size)
-        #print(self.board.size+1)
-        #while True:
-        for i in range(len(final_list)):
-            if final_list[i]==True and col_check != 1:
-                checkpoint=i
-
-                for j in range(checkpoint,len(final_list),+(self.board.size+1)):
-                    if final_list[j]==True:
-                        match_col_black+=1
-                        #print('THIS IS MATCH FOUND')
-                        #print(j)
-
-            elif final_list[i] == False:
-                if match_col_black >= 5:
-                            #self.respond('black wins')
-                    col_check=1
-                    #print('colb')
-                    break
-                else:
-                    match_col_black=0
-            #else:
-                #break
-
-
-        final_list_dia=self.board.connected_component_dia(first_stone_point)
-
-        #print(final_list_dia)
-        #dia forward +2, backward+0
-        dia_f_check=0
-        match_dia_black_forward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_f_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list_dia),+(self.board.size+2)):
-                    if final_list_dia[j] == True:
-                        match_dia_black_forward+=1
-                #print(i)
-                #print('THIS IS TRUE')
-            elif final_list_dia[i]==False:
-                #print(i)
-                #print('THIS IS FALSE')
-                if match_dia_black_forward>=5:
-                    #self.respond('black wins')
-                    dia_f_check=1
-                    #print('diaFb')
-                    break
-                else:
-                    match_dia_black_forward=0
-
-        dia_b_check=0
-        match_dia_black_backward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_b_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list),+(self.board.size)):
-                    if final_list_dia[j]==True:
-                        match_dia_black_backward+=1
-            elif final_list_dia[i]==False:
-                if match_dia_black_backward>=5:
-                        #self.respond('black wins')
-                    dia_b_check=1
-                    #print('diaBb')
-                    break
-                else:
-                    match_dia_black_backward=0
-
-
-        #if match_col_black<5 and match_row_black<5 and match_dia_black_forward<5 and match_dia_black_backward<5:
-            #self.respond('unknown')
-        if dia_b_check==1 or dia_f_check==1 or row_check==1 or col_check==1:
-            wincheck=1
+        if self.win_color == 1:
             self.respond('black')
-            self.gameOver=True
-            self.win_color=1
-            return
-
-
-
-        ###########################CHECK WHITE###################################
-        first_stone_point=0
-
-        for i in color_list:
-            if i == 2:
-                color_check=i
-                break
-            first_stone_point+=1
-        #print(first_stone_point)
-        
-        final_list = self.board.connected_component(first_stone_point)
-        #print(final_list)
-
-        #check row 5
-        row_check=0
-        match_row_white=0
-        for i in final_list:
-            if i == True:
-                match_row_white+=1
-            elif i == False:
-                if match_row_white>=5:
-                    row_check=1
-                    #print('row')
-                    break
-                else:
-                    match_row_white=0
-
-
-        match_col_white=0
-        col_check=0
-        for i in range(len(final_list)):
-            if final_list[i]==True and col_check != 1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list),+(self.board.size+1)):
-                    if final_list[j]==True:
-                        match_col_white+=1
-
-            elif final_list[i] == False:
-                if match_col_white >= 5:
-                    col_check=1
-                    #print('col')
-                    break
-                else:
-                    match_col_white=0
-            #else:
-                #break
-
-
-        final_list_dia=self.board.connected_component_dia(first_stone_point)
-
-
-        dia_f_check=0
-        match_dia_white_forward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_f_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list_dia),+(self.board.size+2)):
-                    if final_list_dia[j] == True:
-                        match_dia_white_forward+=1
-            elif final_list_dia[i]==False:
-                if match_dia_white_forward>=5:
-                    dia_f_check=1
-                    #print('diaF')
-                    break
-                else:
-                    match_dia_white_forward=0
-
-
-        dia_b_check=0
-        match_dia_white_backward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_b_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list),+(self.board.size)):
-                    if final_list_dia[j]==True:
-                        match_dia_white_backward+=1
-            elif final_list_dia[i]==False:
-                if match_dia_white_backward>=5:
-                    dia_b_check=1
-                    #print('diaB')
-                    break
-                else:
-                    match_dia_white_backward=0
-
-        if dia_b_check==1 or dia_f_check==1 or row_check==1 or col_check==1:
-            wincheck=1
+        elif self.win_color == 2:
             self.respond('white')
-            self.gameOver=True
-            self.win_color=2
-            return
-
-        check_empty=self.board.get_empty_points()
-
-        if len(check_empty)==0:
+        elif self.win_color == 3:
             self.respond('draw')
-            self.win_color=3
-            self.gameOver=True
-        elif wincheck!=1:
+        else:
             self.respond('unknown')
 
     def play_cmd(self, args):
@@ -511,15 +346,21 @@ class GtpConnection:
             #     )
             #     return
 
-            #Test if move is on board.
-            if (ord(board_move.lower()[0]) - ord('a')) > self.board.size or int(board_move[1:]) > self.board.size:
-                self.respond("illegal move: \"{}\" wrong coordinate".format(board_move).lower())
+            #lowercase once and reuse it for the checks and the parse
+            bm = board_move.lower()
+
+            #Test if move is on board. Characters beyond the table are
+            #just as invalid as unlisted ones, so treat them as column 0
+            first = ord(bm[0])
+            col = _COL_LUT[first] if first < 256 else 0
+            if col == 0 or col > self.board.size or int(bm[1:]) > self.board.size:
+                self.respond("illegal move: \"{}\" wrong coordinate".format(bm))
                 return
             if color == 3:
-                self.respond("illegal move: \"{}\" wrong coordinate".format(args[1].lower()))
+                self.respond("illegal move: \"{}\" wrong coordinate".format(bm))
                 return
 
-            coord = move_to_coord(args[1], self.board.size)
+            coord = move_to_coord(bm, self.board.size)
             move = coord_to_point(coord[0], coord[1], self.board.size)
 
             #Code for passing
@@ -531,11 +372,19 @@ class GtpConnection:
 
             #Test if coordinate is occupied.
             if self.board.board[move] != EMPTY:
-                self.respond("illegal move: \"{}\" occupied".format(board_move.lower()))
+                self.respond("illegal move: \"{}\" occupied".format(bm))
                 return
             else:
                 self.board.board[move] = color
                 self.board.current_player = GoBoardUtil.opponent(color)
+                self._move_seq += 1
+                self._empty_cache = None
+                #keep the cached legal-move list in sync - the played
+                #point is the only one that stopped being legal; build
+                #the key exactly like the cache entries are built
+                if self._legal_sorted is not None:
+                    self._legal_sorted.remove(
+                        _COLUMN_LETTERS[coord[1] - 1] + str(coord[0]))
                 self.respond()
                 return
 
@@ -553,13 +402,14 @@ class GtpConnection:
 
         self.check_result([])
 
-        moves = self.board.get_empty_points()
-        np.random.shuffle(moves)
+        moves = self._empty_points()
 
         # move = self.go_engine.get_move(self.board, color)
 
         if not self.gameOver:
-            move_coord = point_to_coord(moves[0], self.board.size)
+            #pick one random move directly instead of shuffling them all
+            move = moves[np.random.randint(moves.size)]
+            move_coord = point_to_coord(move, self.board.size)
             move_as_string = format_point(move_coord)
             # self.play_cmd([board_color, move_as_string])
             # self.board.board[moves[0]] = color
@@ -610,238 +460,75 @@ class GtpConnection:
         board_color = args[0].lower()
         color = color_to_int(board_color)
         moves = GoBoardUtil.generate_legal_moves(self.board, color)
-        gtp_moves = []
-        for move in moves:
-            coords = point_to_coord(move, self.board.size)
-            gtp_moves.append(format_point(coords))
-        sorted_moves = " ".join(sorted(gtp_moves))
-        self.respond(sorted_moves)
+        #sort numerically by (column, row) instead of string-sorting
+        rows, cols = np.divmod(np.asarray(moves, dtype=int), self.board.size + 1)
+        order = np.lexsort((rows, cols))
+        gtp_moves = [format_point((row, col))
+                     for row, col in zip(rows[order], cols[order])]
+        self.respond(" ".join(gtp_moves))
 
 
     def check_result(self, args):
         """ Implement this function for Assignment 1 """
-        #unknow=0
-        #final_check=False
-        #test_list=[]
-        #while final_check == False:
-        #find first stone color on the board
-        wincheck=0
-
+        #board unchanged since the last scan - gameOver/win_color still valid
+        if self._scanned_seq == self._move_seq:
+            return
+        self._scanned_seq = self._move_seq
 
-        first_stone_point=0
-        color_list=[]
-        for i in range((self.board.size+1)*(self.board.size+1)-1):
-            color_list.append(self.board.get_color(i))#return [3,3,3,3,0,0,0,0....]
+        board = self.board
+        board_arr = board.board
+        ns = board.size + 1
 
         ##################################CHECK BLACK##############################
-        #print(color_list)
-        for i in color_list:
-            #first_stone_point+=1
-                #if i==1 or i==2:
-            if i == 1:
-                color_check=i
-                break
-            first_stone_point+=1
-        
-        final_list = self.board.connected_component(first_stone_point)
-        #print(first_stone_point)
-        #print(final_list)
-        #print(final_list[1])
-
-        #check row 5
-        #print(final_list)
-        row_check=0
-        match_row_black=0
-        for i in final_list:
-            if i == True:
-                match_row_black+=1
-            elif i == False:
-                if match_row_black>=5:
-                    #self.respond('black wins')
-                    row_check=1
-                    #print('rowb')
-                    break
-                else:
-                    match_row_black=0
-
-            #check col 5
-        match_col_black=0
-        col_check=0
-        #print(self.board.size)
-        #print(self.board.size+1)
-        #while True:
-        for i in range(len(final_list)):
-            if final_list[i]==True and col_check != 1:
-                checkpoint=i
-
-                for j in range(checkpoint,len(final_list),+(self.board.size+1)):
-                    if final_list[j]==True:
-                        match_col_black+=1
-                        #print('THIS IS MATCH FOUND')
-                        #print(j)
-
-            elif final_list[i] == False:
-                if match_col_black >= 5:
-                            #self.respond('black wins')
-                    col_check=1
-                    #print('colb')
-                    break
-                else:
-                    match_col_black=0
-            #else:
-                #break
-
-
-        final_list_dia=self.board.connected_component_dia(first_stone_point)
-
-        #print(final_list_dia)
-        #dia forward +2, backward+0
-        dia_f_check=0
-        match_dia_black_forward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_f_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list_dia),+(self.board.size+2)):
-                    if final_list_dia[j] == True:
-                        match_dia_black_forward+=1
-                #print(i)
-                #print('THIS IS TRUE')
-            elif final_list_dia[i]==False:
-                #print(i)
-                #print('THIS IS FALSE')
-                if match_dia_black_forward>=5:
-                    #self.respond('black wins')
-                    dia_f_check=1
-                    #print('diaFb')
-                    break
-                else:
-                    match_dia_black_forward=0
-
-        dia_b_check=0
-        match_dia_black_backward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_b_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list),+(self.board.size)):
-                    if final_list_dia[j]==True:
-                        match_dia_black_backward+=1
-            elif final_list_dia[i]==False:
-                if match_dia_black_backward>=5:
-                        #self.respond('black wins')
-                    dia_b_check=1
-                    #print('diaBb')
-                    break
-                else:
-                    match_dia_black_backward=0
-
-
-        #if match_col_black<5 and match_row_black<5 and match_dia_black_forward<5 and match_dia_black_backward<5:
-            #self.respond('unknown')
-        if dia_b_check==1 or dia_f_check==1 or row_check==1 or col_check==1:
-            wincheck=1
+        #scan the whole color mask directly - no connected component or
+        #first-stone search needed, and wins in any component are found
+        black_mask = board_arr == BLACK
+
+        #row stride 1, col stride size+1, dia forward size+2, backward size
+        if (_has_five(black_mask, 1)
+                or _has_five(black_mask, ns)
+                or _has_five(black_mask, ns + 1)
+                or _has_five(black_mask, ns - 1)):
             self.gameOver=True
             self.win_color=1
             return
 
-
-
         ###########################CHECK WHITE###################################
-        first_stone_point=0
-
-        for i in color_list:
-            if i == 2:
-                color_check=i
-                break
-            first_stone_point+=1
-        #print(first_stone_point)
-        
-        final_list = self.board.connected_component(first_stone_point)
-        #print(final_list)
-
-        #check row 5
-        row_check=0
-        match_row_white=0
-        for i in final_list:
-            if i == True:
-                match_row_white+=1
-            elif i == False:
-                if match_row_white>=5:
-                    row_check=1
-                    #print('row')
-                    break
-                else:
-                    match_row_white=0
-
-
-        match_col_white=0
-        col_check=0
-        for i in range(len(final_list)):
-            if final_list[i]==True and col_check != 1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list),+(self.board.size+1)):
-                    if final_list[j]==True:
-                        match_col_white+=1
-
-            elif final_list[i] == False:
-                if match_col_white >= 5:
-                    col_check=1
-                    #print('col')
-                    break
-                else:
-                    match_col_white=0
-            #else:
-                #break
-
-
-        final_list_dia=self.board.connected_component_dia(first_stone_point)
-
-
-        dia_f_check=0
-        match_dia_white_forward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_f_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list_dia),+(self.board.size+2)):
-                    if final_list_dia[j] == True:
-                        match_dia_white_forward+=1
-            elif final_list_dia[i]==False:
-                if match_dia_white_forward>=5:
-                    dia_f_check=1
-                    #print('diaF')
-                    break
-                else:
-                    match_dia_white_forward=0
-
-
-        dia_b_check=0
-        match_dia_white_backward=0
-        for i in range(len(final_list_dia)):
-            if final_list_dia[i]==True and dia_b_check!=1:
-                checkpoint=i
-                for j in range(checkpoint,len(final_list),+(self.board.size)):
-                    if final_list_dia[j]==True:
-                        match_dia_white_backward+=1
-            elif final_list_dia[i]==False:
-                if match_dia_white_backward>=5:
-                    dia_b_check=1
-                    #print('diaB')
-                    break
-                else:
-                    match_dia_white_backward=0
-
-        if dia_b_check==1 or dia_f_check==1 or row_check==1 or col_check==1:
-            wincheck=1
+        white_mask = board_arr == WHITE
+
+        if (_has_five(white_mask, 1)
+                or _has_five(white_mask, ns)
+                or _has_five(white_mask, ns + 1)
+                or _has_five(white_mask, ns - 1)):
             self.gameOver=True
             self.win_color=2
             return
 
-        check_empty=self.board.get_empty_points()
+        check_empty=self._empty_points()
 
         if len(check_empty)==0:
             self.win_color=3
             self.gameOver=True
 
 
+def _has_five(marker, stride):
+    """
+    Check a boolean board mask (e.g. board == BLACK)
+    for five points set in a row at the given 1-d stride:
+    1 = row, size+1 = column, size+2 / size = the two diagonals.
+    The BORDER padding breaks any run that would wrap around an edge,
+    so five shifted slices ANDed together do the whole scan in NumPy.
+    """
+    n = len(marker)
+    span = 4 * stride
+    if n <= span:
+        return False
+    hits = marker[: n - span]
+    for k in range(1, 5):
+        hits = hits & marker[k * stride : n - span + k * stride]
+    return bool(hits.any())
+
+
 def point_to_coord(point, boardsize):
     """
     Transform point given as board array index 
@@ -881,12 +568,10 @@ def move_to_coord(point_str, board_size):
     if s == "pass":
         return PASS
     try:
-        col_c = s[0]
-        if (not "a" <= col_c <= "z") or col_c == "i":
+        #table lookup replaces the range tests and the "skip i" branch
+        col = _COL_LUT[ord(s[0])]
+        if col == 0:
             raise ValueError
-        col = ord(col_c) - ord("a")
-        if col_c < "i":
-            col += 1
         row = int(s[1:])
         if row < 1:
             raise ValueError